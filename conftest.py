@@ -8,17 +8,23 @@ import pytest
 import allure
 import os
 import platform
+import re
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
 
+# Максимальный размер HTML кода страницы во вложении без CDP (64 КБ)
+HTML_ATTACH_LIMIT = 65536
+
+
 def pytest_configure(config):
     """Конфигурация pytest при запуске."""
     # Создаём директорию для результатов Allure, если её нет
+    # exist_ok: при запуске через pytest-xdist хук выполняется в каждом воркере
     allure_dir = config.getoption("--alluredir")
-    if allure_dir and not os.path.exists(allure_dir):
-        os.makedirs(allure_dir)
+    if allure_dir:
+        os.makedirs(allure_dir, exist_ok=True)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -28,58 +34,81 @@ def pytest_runtest_makereport(item, call):
     Добавляет скриншоты и логи в случае падения теста.
     """
     outcome = yield
+    
+    # Быстрый выход для успешных тестов и фаз setup/teardown
+    if call.when != "call" or call.excinfo is None:
+        return
+    
     rep = outcome.get_result()
+    if not rep.failed:
+        return
     
-    # Добавляем информацию о тесте в Allure при падении
-    if rep.when == "call" and rep.failed:
-        # Получаем driver из фикстуры, если он доступен
-        if hasattr(item, "funcargs") and "driver" in item.funcargs:
-            driver = item.funcargs["driver"]
-            
-            # Прикрепляем скриншот
-            try:
-                screenshot = driver.get_screenshot_as_png()
-                allure.attach(
-                    screenshot,
-                    name="Скриншот при падении теста",
-                    attachment_type=allure.attachment_type.PNG
-                )
-            except Exception as e:
-                allure.attach(
-                    str(e),
-                    name="Ошибка получения скриншота",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-            
-            # Прикрепляем URL текущей страницы
-            try:
-                current_url = driver.current_url
-                allure.attach(
-                    current_url,
-                    name="URL при падении теста",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-            except Exception as e:
+    # Получаем driver из фикстуры, если он доступен
+    driver = getattr(item, "funcargs", {}).get("driver")
+    if driver is None:
+        return
+    
+    # Ленивый драйвер (LazyDriver) ещё не запускал браузер - снимать нечего
+    if not getattr(driver, "is_started", True):
+        return
+    
+    # Прикрепляем скриншот
+    try:
+        screenshot = driver.get_screenshot_as_png()
+        allure.attach(
+            screenshot,
+            name="Скриншот при падении теста",
+            attachment_type=allure.attachment_type.PNG
+        )
+    except Exception as e:
+        allure.attach(
+            str(e),
+            name="Ошибка получения скриншота",
+            attachment_type=allure.attachment_type.TEXT
+        )
+    
+    # Прикрепляем URL текущей страницы
+    try:
+        current_url = driver.current_url
+        allure.attach(
+            current_url,
+            name="URL при падении теста",
+            attachment_type=allure.attachment_type.TEXT
+        )
+    except Exception as e:
+        allure.attach(
+            str(e),
+            name="Ошибка получения URL",
+            attachment_type=allure.attachment_type.TEXT
+        )
+    
+    # Прикрепляем снимок страницы только по запросу (ALLURE_ATTACH_HTML=1)
+    if os.environ.get("ALLURE_ATTACH_HTML") == "1":
+        try:
+            if hasattr(driver, "execute_cdp_cmd"):
+                # Chromium: снимок MHTML одним CDP-запросом
+                snapshot = driver.execute_cdp_cmd(
+                    "Page.captureSnapshot", {"format": "mhtml"}
+                )["data"]
                 allure.attach(
-                    str(e),
-                    name="Ошибка получения URL",
-                    attachment_type=allure.attachment_type.TEXT
+                    snapshot.encode("utf-8"),
+                    name="MHTML снимок страницы",
+                    attachment_type=allure.attachment_type.TEXT,
+                    extension="mhtml"
                 )
-            
-            # Прикрепляем HTML код страницы
-            try:
-                page_source = driver.page_source
+            else:
+                page_source = driver.page_source[:HTML_ATTACH_LIMIT]
                 allure.attach(
                     page_source,
                     name="HTML код страницы",
                     attachment_type=allure.attachment_type.HTML
                 )
-            except Exception as e:
-                allure.attach(
-                    str(e),
-                    name="Ошибка получения HTML",
-                    attachment_type=allure.attachment_type.TEXT
-                )
+        except Exception as e:
+            allure.attach(
+                str(e),
+                name="Ошибка получения HTML",
+                attachment_type=allure.attachment_type.TEXT
+            )
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -87,35 +116,37 @@ def test_environment():
     """
     Автоматическая фикстура для добавления информации о тестовом окружении.
     Выполняется один раз за сессию тестирования.
+    Отключается переменной окружения CI_SKIP_ENV_ATTACH.
     """
-    # Добавляем информацию об окружении
-    allure.attach(
-        f"Операционная система: {platform.system()} {platform.release()}",
-        name="Информация об ОС",
-        attachment_type=allure.attachment_type.TEXT
-    )
+    if os.environ.get("CI_SKIP_ENV_ATTACH"):
+        return
     
-    allure.attach(
+    # Собираем информацию об окружении в одно вложение
+    environment_info = "\n".join([
+        f"Операционная система: {platform.system()} {platform.release()}",
         f"Python версия: {platform.python_version()}",
-        name="Версия Python",
-        attachment_type=allure.attachment_type.TEXT
-    )
+        f"Время запуска: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+    ])
     
     allure.attach(
-        f"Время запуска: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        name="Время запуска тестов",
+        environment_info,
+        name="Информация о тестовом окружении",
         attachment_type=allure.attachment_type.TEXT
     )
 
 
 @pytest.fixture(scope="function")
-def browser_logs(driver):
+def browser_logs(request, driver):
     """
     Фикстура для сбора логов браузера.
-    Собирает логи браузера после каждого теста.
+    Собирает логи браузера после теста, помеченного маркером capture_logs.
     """
     yield
     
+    # Без маркера не делаем лишний запрос к драйверу
+    if request.node.get_closest_marker("capture_logs") is None:
+        return
+    
     try:
         # Получаем логи браузера
         logs = driver.get_log('browser')
@@ -134,29 +165,13 @@ def browser_logs(driver):
         )
 
 
-@pytest.fixture(scope="function")
-def test_data():
-    """
-    Фикстура с тестовыми данными.
-    Предоставляет централизованный доступ к тестовым данным.
-    """
-    return {
-        "valid_user": {
-            "username": "tomsmith",
-            "password": "SuperSecretPassword!"
-        },
-        "invalid_users": [
-            {"username": "invaliduser", "password": "wrongpassword"},
-            {"username": "tomsmith", "password": "wrongpassword"},
-            {"username": "invaliduser", "password": "SuperSecretPassword!"},
-            {"username": "", "password": ""},
-            {"username": "tomsmith", "password": ""}
-        ],
-        "test_urls": {
-            "login_page": "https://the-internet.herokuapp.com/login",
-            "secure_area": "https://the-internet.herokuapp.com/secure"
-        }
-    }
+# Правила автоматической маркировки: шаблон имени теста -> маркер
+MARKER_RULES = (
+    (re.compile(r"login", re.IGNORECASE), pytest.mark.login),
+    (re.compile(r"successful|positive", re.IGNORECASE), pytest.mark.positive),
+    (re.compile(r"unsuccessful|invalid|negative", re.IGNORECASE), pytest.mark.negative),
+    (re.compile(r"empty|edge", re.IGNORECASE), pytest.mark.edge_case),
+)
 
 
 def pytest_collection_modifyitems(config, items):
@@ -165,18 +180,10 @@ def pytest_collection_modifyitems(config, items):
     Добавляет автоматические маркеры на основе имён тестов.
     """
     for item in items:
-        # Добавляем маркер на основе имени теста
-        if "login" in item.name.lower():
-            item.add_marker(pytest.mark.login)
-        
-        if "successful" in item.name.lower() or "positive" in item.name.lower():
-            item.add_marker(pytest.mark.positive)
-        
-        if "unsuccessful" in item.name.lower() or "invalid" in item.name.lower() or "negative" in item.name.lower():
-            item.add_marker(pytest.mark.negative)
-        
-        if "empty" in item.name.lower() or "edge" in item.name.lower():
-            item.add_marker(pytest.mark.edge_case)
+        # Добавляем маркеры на основе имени теста
+        for pattern, marker in MARKER_RULES:
+            if pattern.search(item.name):
+                item.add_marker(marker)
 
 
 # Дополнительная конфигурация для запуска в разных режимах
@@ -7,13 +7,40 @@ the-internet.herokuapp.com/login
 Автор: Березина Анастасия Дмитриевна
 """
 
+import copy
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+
+
+# Настройки Chrome, общие для всех запусков драйвера
+_CHROME_OPTS = Options()
+for _argument in (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--window-size=1920,1080",
+    "--blink-settings=imagesEnabled=false",
+    # Связь chromedriver с браузером через pipe вместо TCP-порта
+    "--remote-debugging-pipe",
+):
+    _CHROME_OPTS.add_argument(_argument)
+
+# Не ждём загрузки всех ресурсов: готовность формы проверяют явные ожидания
+_CHROME_OPTS.page_load_strategy = "eager"
+
+# Изображения и шрифты тестам не нужны - не загружаем их
+_CHROME_OPTS.add_experimental_option("prefs", {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+})
 
 
 class LoginPage:
@@ -27,7 +54,9 @@ class LoginPage:
             driver: Экземпляр WebDriver
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, timeout=5, poll_frequency=0.1)
+        # Сообщение об ошибке появляется сразу после отправки формы
+        self.error_wait = WebDriverWait(driver, timeout=3, poll_frequency=0.1)
         
         # URL страницы авторизации
         self.login_url = "https://the-internet.herokuapp.com/login"
@@ -40,8 +69,13 @@ class LoginPage:
         # Локаторы для проверки результатов
         self.success_message = (By.CSS_SELECTOR, ".flash.success")
         self.error_message = (By.CSS_SELECTOR, ".flash.error")
-        self.secure_area_header = (By.CSS_SELECTOR, ".subheader")
         self.logout_button = (By.CSS_SELECTOR, "a[href='/logout']")
+        # Любой из признаков успешного входа: сообщение об успехе или кнопка выхода
+        self.success_indicators = (By.CSS_SELECTOR, ".flash.success, a[href='/logout']")
+        
+        # Тексты сообщений, полученные при проверке результата авторизации
+        self._last_success_text = ""
+        self._last_error_text = ""
     
     def open_login_page(self):
         """Открытие страницы авторизации."""
@@ -54,40 +88,23 @@ class LoginPage:
         assert "login" in self.driver.current_url.lower(), \
             f"Ожидалась страница логина, текущий URL: {self.driver.current_url}"
     
-    def enter_username(self, username: str):
-        """Ввод имени пользователя."""
-        username_element = self.wait.until(
-            EC.element_to_be_clickable(self.username_field)
-        )
-        username_element.clear()
-        username_element.send_keys(username)
-    
-    def enter_password(self, password: str):
-        """Ввод пароля."""
-        password_element = self.wait.until(
-            EC.element_to_be_clickable(self.password_field)
-        )
-        password_element.clear()
-        password_element.send_keys(password)
-    
-    def click_login_button(self):
-        """Нажатие кнопки входа."""
-        login_button_element = self.wait.until(
-            EC.element_to_be_clickable(self.login_button)
-        )
-        login_button_element.click()
-    
-    def perform_login(self, username: str, password: str):
+    def perform_login_fast(self, username: str, password: str):
         """
-        Выполнение полного процесса авторизации.
+        Авторизация одним JS-вызовом без эмуляции ввода с клавиатуры.
+        
+        Заполняет оба поля и отправляет форму за один запрос к драйверу.
         
         Args:
             username: Имя пользователя
             password: Пароль
         """
-        self.enter_username(username)
-        self.enter_password(password)
-        self.click_login_button()
+        self.driver.execute_script(
+            "document.getElementById(arguments[0]).value = arguments[3];"
+            "document.getElementById(arguments[1]).value = arguments[4];"
+            "document.querySelector(arguments[2]).click();",
+            self.username_field[1], self.password_field[1], self.login_button[1],
+            username, password
+        )
     
     def is_login_successful(self) -> bool:
         """
@@ -97,22 +114,18 @@ class LoginPage:
             True если авторизация успешна
         """
         try:
-            # Ждём появления сообщения об успехе или кнопки выхода
-            self.wait.until(
-                lambda driver: (
-                    len(driver.find_elements(*self.success_message)) > 0 or
-                    len(driver.find_elements(*self.logout_button)) > 0
+            # Одна проверка в браузере вместо двух find_elements на каждый опрос;
+            # заодно запоминаем текст сообщения об успехе
+            result = self.wait.until(
+                lambda driver: driver.execute_script(
+                    "if (!document.querySelector(arguments[0])) return null;"
+                    "var flash = document.querySelector(arguments[1]);"
+                    "return {text: flash ? flash.innerText : ''};",
+                    self.success_indicators[1], self.success_message[1]
                 )
             )
-            
-            # Проверяем наличие элементов успешной авторизации
-            success_elements = [
-                self.driver.find_elements(*self.success_message),
-                self.driver.find_elements(*self.logout_button),
-                self.driver.find_elements(*self.secure_area_header)
-            ]
-            
-            return any(len(elements) > 0 for elements in success_elements)
+            self._last_success_text = result["text"].strip()
+            return True
             
         except TimeoutException:
             return False
@@ -125,17 +138,22 @@ class LoginPage:
             True если авторизация неуспешна
         """
         try:
-            # Ждём появления сообщения об ошибке
-            self.wait.until(EC.presence_of_element_located(self.error_message))
-            
-            error_elements = self.driver.find_elements(*self.error_message)
-            return len(error_elements) > 0
+            # Ждём появления сообщения об ошибке - этого достаточно для проверки
+            error_element = self.error_wait.until(
+                EC.presence_of_element_located(self.error_message)
+            )
+            self._last_error_text = error_element.text.strip()
+            return True
             
         except TimeoutException:
             return False
     
     def get_success_message_text(self) -> str:
         """Получение текста сообщения об успехе."""
+        # Текст уже получен при проверке успешной авторизации
+        if self._last_success_text:
+            return self._last_success_text
+        
         try:
             success_element = self.wait.until(
                 EC.presence_of_element_located(self.success_message)
@@ -146,6 +164,10 @@ class LoginPage:
     
     def get_error_message_text(self) -> str:
         """Получение текста сообщения об ошибке."""
+        # Текст уже получен при проверке неуспешной авторизации
+        if self._last_error_text:
+            return self._last_error_text
+        
         try:
             error_element = self.wait.until(
                 EC.presence_of_element_located(self.error_message)
@@ -153,6 +175,43 @@ class LoginPage:
             return error_element.text.strip()
         except TimeoutException:
             return ""
+    
+    def snapshot_result(self) -> dict:
+        """
+        Получение состояния страницы после авторизации одним JS-вызовом.
+        
+        Returns:
+            Словарь с текущим URL (url) и признаком наличия кнопки выхода (logout)
+        """
+        return self.driver.execute_script(
+            "return {url: location.href, logout: !!document.querySelector(arguments[0])};",
+            self.logout_button[1]
+        )
+    
+    def get_form_state(self) -> dict:
+        """
+        Получение состояния формы авторизации одним JS-вызовом.
+        
+        Returns:
+            Словарь с заголовком страницы, количеством найденных полей
+            и кнопки, текстом кнопки и признаками активности элементов
+        """
+        return self.driver.execute_script(
+            "var u = document.querySelectorAll('#' + CSS.escape(arguments[0])),"
+            " p = document.querySelectorAll('#' + CSS.escape(arguments[1])),"
+            " b = document.querySelectorAll(arguments[2]);"
+            "return {"
+            "title: document.title,"
+            " username_count: u.length,"
+            " password_count: p.length,"
+            " login_button_count: b.length,"
+            " button_text: b.length ? b[0].innerText : '',"
+            " username_enabled: u.length > 0 && !u[0].disabled,"
+            " password_enabled: p.length > 0 && !p[0].disabled,"
+            " login_button_enabled: b.length > 0 && !b[0].disabled"
+            "};",
+            self.username_field[1], self.password_field[1], self.login_button[1]
+        )
 
 
 class TestLoginForm:
@@ -180,7 +239,7 @@ class TestLoginForm:
         login_page.open_login_page()
         
         # Act (действие)
-        login_page.perform_login(self.VALID_USERNAME, self.VALID_PASSWORD)
+        login_page.perform_login_fast(self.VALID_USERNAME, self.VALID_PASSWORD)
         
         # Основная проверка - авторизация успешна
         assert login_page.is_login_successful(), \
@@ -191,32 +250,45 @@ class TestLoginForm:
         assert "You logged into a secure area!" in success_message, \
             f"Ожидалось сообщение об успехе, получено: '{success_message}'"
         
+        # URL и кнопку выхода получаем одним запросом к браузеру
+        result = login_page.snapshot_result()
+        
         # Проверяем что перешли на secure area
-        assert "secure" in driver.current_url, \
-            f"После успешной авторизации должен быть переход на secure area, текущий URL: {driver.current_url}"
+        assert "secure" in result["url"], \
+            f"После успешной авторизации должен быть переход на secure area, текущий URL: {result['url']}"
         
         # Проверяем наличие кнопки выхода
-        logout_buttons = driver.find_elements(By.CSS_SELECTOR, "a[href='/logout']")
-        assert len(logout_buttons) > 0, "Кнопка выхода должна присутствовать после успешной авторизации"
+        assert result["logout"], "Кнопка выхода должна присутствовать после успешной авторизации"
     
-    def test_unsuccessful_login(self, driver):
+    @pytest.mark.parametrize("username, password, expected_error", [
+        pytest.param(INVALID_USERNAME, INVALID_PASSWORD, "Your username is invalid!",
+                     id="invalid_credentials"),
+        pytest.param(VALID_USERNAME, INVALID_PASSWORD, "Your password is invalid!",
+                     id="invalid_password_valid_username"),
+        pytest.param("", "", "Your username is invalid!",
+                     id="empty_credentials"),
+    ])
+    def test_unsuccessful_login(self, driver, username, password, expected_error):
         """
         Тест неуспешной авторизации.
         
         Проверяет:
-        - Блокировку входа с некорректными данными
-        - Отображение сообщения об ошибке
+        - Блокировку входа с некорректными или пустыми данными
+        - Отображение соответствующего сообщения об ошибке
         - Остаемся на странице логина
         - Отсутствие кнопки выхода
         
         Args:
             driver: Фикстура WebDriver
+            username: Имя пользователя
+            password: Пароль
+            expected_error: Ожидаемый фрагмент сообщения об ошибке
         """
         login_page = LoginPage(driver)
         login_page.open_login_page()
         
         # Act (действие)
-        login_page.perform_login(self.INVALID_USERNAME, self.INVALID_PASSWORD)
+        login_page.perform_login_fast(username, password)
         
         # Assert (проверка)
         # Основная проверка - авторизация НЕ успешна
@@ -225,66 +297,18 @@ class TestLoginForm:
         
         # Дополнительные проверки
         error_message = login_page.get_error_message_text()
-        assert "Your username is invalid!" in error_message, \
+        assert expected_error in error_message, \
             f"Ожидалось сообщение об ошибке, получено: '{error_message}'"
         
-        # Проверяем что остались на странице логина
-        assert "login" in driver.current_url, \
-            f"После неуспешной авторизации должны остаться на странице логина, текущий URL: {driver.current_url}"
-        
-        # Проверяем отсутствие кнопки выхода
-        logout_buttons = driver.find_elements(By.CSS_SELECTOR, "a[href='/logout']")
-        assert len(logout_buttons) == 0, "Кнопка выхода НЕ должна присутствовать после неуспешной авторизации"
-    
-    def test_empty_credentials_login(self, driver):
-        """
-        Тест авторизации с пустыми данными.
-        
-        Проверяет:
-        - Обработку пустых полей
-        - Отображение соответствующего сообщения об ошибке
-        
-        Args:
-            driver: Фикстура WebDriver
-        """
-        login_page = LoginPage(driver)
-        login_page.open_login_page()
-        
-        # Act (действие) - отправляем форму с пустыми полями
-        login_page.perform_login("", "")
-        
-        # Assert (проверка)
-        assert login_page.is_login_failed(), \
-            "Авторизация должна быть неуспешной с пустыми данными"
+        # URL и кнопку выхода получаем одним запросом к браузеру
+        result = login_page.snapshot_result()
         
         # Проверяем что остались на странице логина
-        assert "login" in driver.current_url, \
-            "После авторизации с пустыми данными должны остаться на странице логина"
-    
-    def test_invalid_password_valid_username(self, driver):
-        """
-        Тест с корректным логином но неверным паролем.
-        
-        Проверяет:
-        - Обработку случая с правильным логином и неверным паролем
-        - Специфичное сообщение об ошибке пароля
+        assert "login" in result["url"], \
+            f"После неуспешной авторизации должны остаться на странице логина, текущий URL: {result['url']}"
         
-        Args:
-            driver: Фикстура WebDriver
-        """
-        login_page = LoginPage(driver)
-        login_page.open_login_page()
-        
-        # Act (действие) - правильный логин, неверный пароль
-        login_page.perform_login(self.VALID_USERNAME, self.INVALID_PASSWORD)
-        
-        # Assert (проверка)
-        assert login_page.is_login_failed(), \
-            "Авторизация должна быть неуспешной с неверным паролем"
-        
-        error_message = login_page.get_error_message_text()
-        assert "Your password is invalid!" in error_message, \
-            f"Ожидалось сообщение об ошибке пароля, получено: '{error_message}'"
+        # Проверяем отсутствие кнопки выхода
+        assert not result["logout"], "Кнопка выхода НЕ должна присутствовать после неуспешной авторизации"
     
     def test_ui_elements_presence(self, driver):
         """
@@ -302,58 +326,92 @@ class TestLoginForm:
         login_page = LoginPage(driver)
         login_page.open_login_page()
         
+        # Состояние формы получаем одним запросом к браузеру
+        form_state = login_page.get_form_state()
+        
         # Assert (проверки наличия элементов)
         
         # Проверяем заголовок страницы
-        assert "The Internet" in driver.title, \
-            f"Ожидался заголовок 'The Internet', получен: '{driver.title}'"
+        assert "The Internet" in form_state["title"], \
+            f"Ожидался заголовок 'The Internet', получен: '{form_state['title']}'"
         
         # Проверяем наличие поля логина
-        username_fields = driver.find_elements(*login_page.username_field)
-        assert len(username_fields) == 1, "Поле логина должно присутствовать на странице"
+        assert form_state["username_count"] == 1, "Поле логина должно присутствовать на странице"
         
         # Проверяем наличие поля пароля
-        password_fields = driver.find_elements(*login_page.password_field)
-        assert len(password_fields) == 1, "Поле пароля должно присутствовать на странице"
+        assert form_state["password_count"] == 1, "Поле пароля должно присутствовать на странице"
         
         # Проверяем наличие кнопки входа
-        login_buttons = driver.find_elements(*login_page.login_button)
-        assert len(login_buttons) == 1, "Кнопка входа должна присутствовать на странице"
+        assert form_state["login_button_count"] == 1, "Кнопка входа должна присутствовать на странице"
         
         # Проверяем что кнопка имеет правильный текст
-        login_button = login_buttons[0]
-        button_text = login_button.text.strip()
+        button_text = form_state["button_text"].strip()
         assert button_text.lower() in ["login", "log in", "войти"], \
             f"Кнопка должна иметь текст для входа, получен: '{button_text}'"
         
         # Проверяем что поля доступны для ввода
-        username_element = driver.find_element(*login_page.username_field)
-        password_element = driver.find_element(*login_page.password_field)
+        assert form_state["username_enabled"], "Поле логина должно быть активным"
+        assert form_state["password_enabled"], "Поле пароля должно быть активным"
+        assert form_state["login_button_enabled"], "Кнопка входа должна быть активной"
+
+
+class LazyDriver:
+    """
+    Ленивая обёртка над Chrome WebDriver.
+    
+    Браузер запускается при первом обращении к любому атрибуту драйвера,
+    поэтому тесты, которые не используют браузер, не платят за его запуск.
+    """
+    
+    def __init__(self, options):
+        """
+        Инициализация обёртки.
         
-        assert username_element.is_enabled(), "Поле логина должно быть активным"
-        assert password_element.is_enabled(), "Поле пароля должно быть активным"
-        assert login_button.is_enabled(), "Кнопка входа должна быть активной"
+        Args:
+            options: Настройки Chrome для запуска браузера
+        """
+        self._options = options
+        self._real = None
+    
+    def __getattr__(self, name):
+        """Запуск браузера при первом обращении и проксирование атрибутов."""
+        if self._real is None:
+            self._real = webdriver.Chrome(options=self._options)
+        return getattr(self._real, name)
+    
+    @property
+    def is_started(self) -> bool:
+        """Был ли уже запущен браузер."""
+        return self._real is not None
+    
+    def quit(self):
+        """Закрытие браузера, если он был запущен."""
+        if self._real is not None:
+            self._real.quit()
+            self._real = None
 
 
 # Фикстура для WebDriver
-@pytest.fixture
-def driver():
+@pytest.fixture(scope="session")
+def driver(request):
     """
     Фикстура для создания и настройки WebDriver.
     
+    Браузер запускается один раз на всю сессию тестирования,
+    состояние между тестами сбрасывает фикстура _reset_browser.
+    
     Yields:
-        WebDriver: Настроенный экземпляр Chrome WebDriver
+        LazyDriver: Chrome WebDriver, запускаемый при первом обращении
     """
     # Selenium Manager автоматически скачает подходящий драйвер
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
+    options = copy.deepcopy(_CHROME_OPTS)
     
-    driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(10)
+    # Логи консоли буферизуются только если их собирает хотя бы один тест
+    if any(item.get_closest_marker("capture_logs") for item in request.session.items):
+        options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    
+    # Неявное ожидание не задаём: все ожидания в LoginPage явные
+    driver = LazyDriver(options)
     
     # Возвращаем драйвер для использования в тестах
     yield driver
@@ -361,37 +419,25 @@ def driver():
     driver.quit()
 
 
-# Дополнительные фикстуры для тестовых данных
-@pytest.fixture
-def valid_credentials():
-    """Фикстура с корректными данными авторизации."""
-    return {
-        "username": "tomsmith",
-        "password": "SuperSecretPassword!"
-    }
-
-
-@pytest.fixture
-def invalid_credentials():
-    """Фикстура с некорректными данными авторизации."""
-    return [
-        {"username": "invaliduser", "password": "wrongpassword"},
-        {"username": "tomsmith", "password": "wrongpassword"},
-        {"username": "invaliduser", "password": "SuperSecretPassword!"},
-        {"username": "", "password": ""},
-        {"username": "tomsmith", "password": ""}
-    ]
-
-
-@pytest.fixture
-def login_page(driver):
-    """Фикстура для создания Page Object."""
-    return LoginPage(driver)
+@pytest.fixture(autouse=True)
+def _reset_browser(driver):
+    """Сброс cookies и хранилищ браузера после каждого теста."""
+    yield
+    
+    # Браузер не запускался - сбрасывать нечего
+    if not driver.is_started:
+        return
+    
+    driver.delete_all_cookies()
+    try:
+        driver.execute_script(
+            "window.localStorage.clear(); window.sessionStorage.clear();"
+        )
+    except WebDriverException:
+        # На служебных страницах (data:, about:blank) хранилища недоступны
+        pass
 
 
-# Маркеры для категоризации тестов
-pytestmark = [
-    pytest.mark.ui,
-    pytest.mark.selenium,
-    pytest.mark.login
-]
\ No newline at end of file
+# Маркер модуля; login, positive, negative и edge_case
+# расставляет pytest_collection_modifyitems в conftest.py
+pytestmark = pytest.mark.selenium
\ No newline at end of file
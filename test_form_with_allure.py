@@ -9,12 +9,20 @@ the-internet.herokuapp.com/login
 
 import pytest
 import allure
+import os
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException
+)
+
+
+# Подробные вложения (URL, введённые данные, промежуточные результаты)
+# пишутся в отчёт только при ALLURE_VERBOSE=1
+ALLURE_VERBOSE = os.environ.get("ALLURE_VERBOSE") == "1"
 
 
 @allure.feature("Авторизация")
@@ -30,7 +38,9 @@ class LoginPage:
             driver: Экземпляр WebDriver
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, 10, poll_frequency=0.1)
+        # Признаки успешного входа появляются сразу после редиректа
+        self.success_wait = WebDriverWait(driver, 5, poll_frequency=0.05)
         
         # URL страницы авторизации
         self.login_url = "https://the-internet.herokuapp.com/login"
@@ -43,8 +53,18 @@ class LoginPage:
         # Локаторы для проверки результатов
         self.success_message = (By.CSS_SELECTOR, ".flash.success")
         self.error_message = (By.CSS_SELECTOR, ".flash.error")
-        self.secure_area_header = (By.CSS_SELECTOR, ".subheader")
         self.logout_button = (By.CSS_SELECTOR, "a[href='/logout']")
+        # Любой из признаков успешного входа: сообщение об успехе или кнопка выхода
+        self.success_indicators = (By.CSS_SELECTOR, ".flash.success, a[href='/logout']")
+        
+        # Тексты сообщений, полученные при проверке результата авторизации
+        self._last_success_text = ""
+        self._last_error_text = ""
+        
+        # Элементы формы, найденные при открытии страницы или при первом использовании
+        self._username_el = None
+        self._password_el = None
+        self._login_btn_el = None
     
     @allure.step("Открытие страницы авторизации")
     def open_login_page(self):
@@ -53,55 +73,114 @@ class LoginPage:
             self.driver.get(self.login_url)
         
         with allure.step("Ожидание загрузки формы авторизации"):
-            self.wait.until(EC.presence_of_element_located(self.username_field))
+            self._username_el = self.wait.until(
+                EC.presence_of_element_located(self.username_field)
+            )
+            # Форма загружена целиком - запоминаем поле пароля;
+            # кнопка входа ищется только при нажатии через WebDriver
+            self._password_el = self.driver.find_element(*self.password_field)
         
         with allure.step("Проверка корректности загруженной страницы"):
             current_url = self.driver.current_url
-            allure.attach(current_url, "Текущий URL", allure.attachment_type.TEXT)
+            if ALLURE_VERBOSE:
+                allure.attach(current_url, "Текущий URL", allure.attachment_type.TEXT)
             assert "login" in current_url.lower(), \
                 f"Ожидалась страница логина, текущий URL: {current_url}"
     
+    def _with_form_element(self, attr_name: str, condition, action):
+        """
+        Выполнение действия с элементом формы, найденным при открытии страницы.
+        
+        Если элемент ещё не найден или устарел, он ищется заново.
+        
+        Args:
+            attr_name: Имя атрибута с сохранённым элементом
+            condition: Условие ожидания для повторного поиска элемента
+            action: Функция, выполняющая действие с элементом
+        """
+        element = getattr(self, attr_name)
+        if element is not None:
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                pass
+        
+        element = self.wait.until(condition)
+        setattr(self, attr_name, element)
+        return action(element)
+    
+    def _set_value(self, element, value: str):
+        """
+        Установка значения поля одним JS-вызовом.
+        
+        Вместо посимвольного ввода присваивает value и генерирует
+        события input и change, как при вводе с клавиатуры.
+        
+        Args:
+            element: Поле ввода
+            value: Устанавливаемое значение
+        """
+        self.driver.execute_script(
+            "arguments[0].value = arguments[1];"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+            "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));",
+            element, value
+        )
+    
     @allure.step("Ввод имени пользователя: '{username}'")
     def enter_username(self, username: str):
         """Ввод имени пользователя."""
-        username_element = self.wait.until(
-            EC.element_to_be_clickable(self.username_field)
+        self._with_form_element(
+            "_username_el", EC.element_to_be_clickable(self.username_field),
+            lambda element: self._set_value(element, username)
         )
-        username_element.clear()
-        username_element.send_keys(username)
-        allure.attach(username, "Введённое имя пользователя", allure.attachment_type.TEXT)
+        if ALLURE_VERBOSE:
+            allure.attach(username, "Введённое имя пользователя", allure.attachment_type.TEXT)
     
     @allure.step("Ввод пароля")
     def enter_password(self, password: str):
         """Ввод пароля."""
-        password_element = self.wait.until(
-            EC.element_to_be_clickable(self.password_field)
+        self._with_form_element(
+            "_password_el", EC.element_to_be_clickable(self.password_field),
+            lambda element: self._set_value(element, password)
         )
-        password_element.clear()
-        password_element.send_keys(password)
         # Не логируем пароль в открытом виде в отчёт
-        allure.attach("***", "Пароль введён", allure.attachment_type.TEXT)
+        if ALLURE_VERBOSE:
+            allure.attach("***", "Пароль введён", allure.attachment_type.TEXT)
     
     @allure.step("Нажатие кнопки входа")
-    def click_login_button(self):
-        """Нажатие кнопки входа."""
-        login_button_element = self.wait.until(
-            EC.element_to_be_clickable(self.login_button)
+    def click_login_button(self, native_click: bool = False):
+        """
+        Нажатие кнопки входа.
+        
+        По умолчанию форма отправляется из JS без прокрутки к кнопке
+        и эмуляции клика.
+        
+        Args:
+            native_click: Нажать кнопку через WebDriver, как пользователь
+        """
+        if not native_click:
+            self.driver.execute_script("document.getElementById('login').submit();")
+            return
+        
+        self._with_form_element(
+            "_login_btn_el", EC.element_to_be_clickable(self.login_button),
+            lambda element: element.click()
         )
-        login_button_element.click()
     
     @allure.step("Выполнение авторизации с логином '{username}'")
-    def perform_login(self, username: str, password: str):
+    def perform_login(self, username: str, password: str, native_click: bool = False):
         """
         Выполнение полного процесса авторизации.
         
         Args:
             username: Имя пользователя
             password: Пароль
+            native_click: Нажать кнопку входа через WebDriver вместо отправки формы из JS
         """
         self.enter_username(username)
         self.enter_password(password)
-        self.click_login_button()
+        self.click_login_button(native_click=native_click)
     
     @allure.step("Проверка успешной авторизации")
     def is_login_successful(self) -> bool:
@@ -113,23 +192,21 @@ class LoginPage:
         """
         try:
             # Ждём появления сообщения об успехе или кнопки выхода
-            self.wait.until(
-                lambda driver: (
-                    len(driver.find_elements(*self.success_message)) > 0 or
-                    len(driver.find_elements(*self.logout_button)) > 0
+            # (одна проверка в браузере на каждый опрос) и запоминаем текст сообщения
+            result = self.success_wait.until(
+                lambda driver: driver.execute_script(
+                    "if (!document.querySelector(arguments[0])) return null;"
+                    "var flash = document.querySelector(arguments[1]);"
+                    "return {text: flash ? flash.innerText : ''};",
+                    self.success_indicators[1], self.success_message[1]
                 )
             )
+            self._last_success_text = result["text"].strip()
             
-            # Проверяем наличие элементов успешной авторизации
-            success_elements = [
-                self.driver.find_elements(*self.success_message),
-                self.driver.find_elements(*self.logout_button),
-                self.driver.find_elements(*self.secure_area_header)
-            ]
-            
-            result = any(len(elements) > 0 for elements in success_elements)
-            allure.attach(str(result), "Результат проверки успешной авторизации", allure.attachment_type.TEXT)
-            return result
+            # Ожидание уже подтвердило наличие признаков успешного входа
+            if ALLURE_VERBOSE:
+                allure.attach("True", "Результат проверки успешной авторизации", allure.attachment_type.TEXT)
+            return True
             
         except TimeoutException:
             allure.attach("TimeoutException при проверке успешной авторизации", 
@@ -145,13 +222,15 @@ class LoginPage:
             True если авторизация неуспешна
         """
         try:
-            # Ждём появления сообщения об ошибке
-            self.wait.until(EC.presence_of_element_located(self.error_message))
+            # Ждём появления сообщения об ошибке - этого достаточно для проверки
+            error_element = self.wait.until(
+                EC.presence_of_element_located(self.error_message)
+            )
+            self._last_error_text = error_element.text.strip()
             
-            error_elements = self.driver.find_elements(*self.error_message)
-            result = len(error_elements) > 0
-            allure.attach(str(result), "Результат проверки неуспешной авторизации", allure.attachment_type.TEXT)
-            return result
+            if ALLURE_VERBOSE:
+                allure.attach("True", "Результат проверки неуспешной авторизации", allure.attachment_type.TEXT)
+            return True
             
         except TimeoutException:
             allure.attach("TimeoutException при проверке неуспешной авторизации", 
@@ -161,30 +240,83 @@ class LoginPage:
     @allure.step("Получение текста сообщения об успехе")
     def get_success_message_text(self) -> str:
         """Получение текста сообщения об успехе."""
-        try:
-            success_element = self.wait.until(
-                EC.presence_of_element_located(self.success_message)
-            )
-            text = success_element.text.strip()
-            allure.attach(text, "Сообщение об успехе", allure.attachment_type.TEXT)
-            return text
-        except TimeoutException:
-            allure.attach("Сообщение об успехе не найдено", "Предупреждение", allure.attachment_type.TEXT)
-            return ""
+        # Текст обычно уже получен при проверке результата авторизации
+        text = self._last_success_text
+        if not text:
+            try:
+                success_element = self.wait.until(
+                    EC.presence_of_element_located(self.success_message)
+                )
+                text = success_element.text.strip()
+            except TimeoutException:
+                allure.attach("Сообщение об успехе не найдено", "Предупреждение", allure.attachment_type.TEXT)
+                return ""
+        
+        allure.attach(text, "Сообщение об успехе", allure.attachment_type.TEXT)
+        return text
     
     @allure.step("Получение текста сообщения об ошибке")
     def get_error_message_text(self) -> str:
         """Получение текста сообщения об ошибке."""
-        try:
-            error_element = self.wait.until(
-                EC.presence_of_element_located(self.error_message)
-            )
-            text = error_element.text.strip()
-            allure.attach(text, "Сообщение об ошибке", allure.attachment_type.TEXT)
-            return text
-        except TimeoutException:
-            allure.attach("Сообщение об ошибке не найдено", "Предупреждение", allure.attachment_type.TEXT)
-            return ""
+        # Текст обычно уже получен при проверке результата авторизации
+        text = self._last_error_text
+        if not text:
+            try:
+                error_element = self.wait.until(
+                    EC.presence_of_element_located(self.error_message)
+                )
+                text = error_element.text.strip()
+            except TimeoutException:
+                allure.attach("Сообщение об ошибке не найдено", "Предупреждение", allure.attachment_type.TEXT)
+                return ""
+        
+        allure.attach(text, "Сообщение об ошибке", allure.attachment_type.TEXT)
+        return text
+    
+    @allure.step("Получение состояния страницы после авторизации")
+    def snapshot_result(self) -> dict:
+        """
+        Получение состояния страницы после авторизации одним JS-вызовом.
+        
+        Returns:
+            Словарь с текущим URL (url) и признаком наличия кнопки выхода (logout)
+        """
+        result = self.driver.execute_script(
+            "return {url: location.href, logout: !!document.querySelector(arguments[0])};",
+            self.logout_button[1]
+        )
+        if ALLURE_VERBOSE:
+            allure.attach(str(result), "Состояние страницы после авторизации", allure.attachment_type.TEXT)
+        return result
+    
+    @allure.step("Получение состояния формы авторизации")
+    def get_form_state(self) -> dict:
+        """
+        Получение состояния формы авторизации одним JS-вызовом.
+        
+        Returns:
+            Словарь с заголовком страницы, количеством найденных полей
+            и кнопки, текстом кнопки и признаками активности элементов
+        """
+        form_state = self.driver.execute_script(
+            "var u = document.querySelectorAll('#' + CSS.escape(arguments[0])),"
+            " p = document.querySelectorAll('#' + CSS.escape(arguments[1])),"
+            " b = document.querySelectorAll(arguments[2]);"
+            "return {"
+            "title: document.title,"
+            " username_count: u.length,"
+            " password_count: p.length,"
+            " login_button_count: b.length,"
+            " button_text: b.length ? b[0].innerText : '',"
+            " username_enabled: u.length > 0 && !u[0].disabled,"
+            " password_enabled: p.length > 0 && !p[0].disabled,"
+            " login_button_enabled: b.length > 0 && !b[0].disabled"
+            "};",
+            self.username_field[1], self.password_field[1], self.login_button[1]
+        )
+        if ALLURE_VERBOSE:
+            allure.attach(str(form_state), "Состояние формы", allure.attachment_type.TEXT)
+        return form_state
 
 
 @allure.feature("Авторизация")
@@ -197,198 +329,125 @@ class TestLoginForm:
     INVALID_USERNAME = "invaliduser"
     INVALID_PASSWORD = "wrongpassword"
     
-    @allure.title("Успешная авторизация с корректными данными")
+    # Негативные сценарии идут первыми, успешный вход - последним
+    @pytest.mark.parametrize(
+        "title, username, password, expect_success, expected_message, severity, tags, native_click", [
+            pytest.param("Неуспешная авторизация с некорректными данными",
+                         INVALID_USERNAME, INVALID_PASSWORD, False, "Your username is invalid!",
+                         allure.severity_level.CRITICAL, ("negative", "login", "security"), False,
+                         id="negative_invalid_username"),
+            pytest.param("Авторизация с корректным логином и неверным паролем",
+                         VALID_USERNAME, INVALID_PASSWORD, False, "Your password is invalid!",
+                         allure.severity_level.NORMAL, ("negative", "security", "password"), False,
+                         id="negative_invalid_password"),
+            pytest.param("Авторизация с пустыми учётными данными",
+                         "", "", False, "Your username is invalid!",
+                         allure.severity_level.NORMAL, ("negative", "validation", "edge-case"), False,
+                         id="negative_empty_credentials"),
+            pytest.param("Успешная авторизация с корректными данными",
+                         VALID_USERNAME, VALID_PASSWORD, True, "You logged into a secure area!",
+                         allure.severity_level.CRITICAL, ("smoke", "positive", "login"), False,
+                         id="positive_valid_credentials"),
+            pytest.param("Успешная авторизация нажатием кнопки входа",
+                         VALID_USERNAME, VALID_PASSWORD, True, "You logged into a secure area!",
+                         allure.severity_level.CRITICAL, ("smoke", "positive", "login"), True,
+                         id="positive_native_click"),
+        ]
+    )
+    @allure.title("{title}")
     @allure.description("""
-    Тест проверяет успешную авторизацию пользователя с корректными учётными данными.
+    Тест проверяет результат авторизации для набора учётных данных.
     
     Шаги:
     1. Открыть страницу авторизации
-    2. Ввести корректное имя пользователя
-    3. Ввести корректный пароль
+    2. Ввести имя пользователя
+    3. Ввести пароль
     4. Нажать кнопку входа
-    5. Проверить успешную авторизацию
+    5. Проверить успешную или неуспешную авторизацию и сообщение
     """)
-    @allure.severity(allure.severity_level.CRITICAL)
-    @allure.tag("smoke", "positive", "login")
-    def test_successful_login(self, driver):
+    def test_login(self, driver, title, username, password, expect_success, expected_message,
+                   severity, tags, native_click):
         """
-        Тест успешной авторизации.
+        Тест авторизации с разными учётными данными.
         
-        Проверяет:
-        - Успешный вход с корректными данными
+        Проверяет для успешного входа:
         - Отображение сообщения об успехе
         - Переход на защищённую страницу
         - Появление кнопки выхода
         
-        Args:
-            driver: Фикстура WebDriver
-        """
-        with allure.step("Инициализация Page Object"):
-            login_page = LoginPage(driver)
-        
-        with allure.step("Открытие страницы авторизации"):
-            login_page.open_login_page()
-        
-        with allure.step("Выполнение авторизации с корректными данными"):
-            login_page.perform_login(self.VALID_USERNAME, self.VALID_PASSWORD)
-        
-        with allure.step("Проверка результатов авторизации"):
-            # Основная проверка - авторизация успешна
-            assert login_page.is_login_successful(), \
-                "Авторизация должна быть успешной с корректными данными"
-            
-            # Дополнительные проверки
-            success_message = login_page.get_success_message_text()
-            assert "You logged into a secure area!" in success_message, \
-                f"Ожидалось сообщение об успехе, получено: '{success_message}'"
-            
-            # Проверяем что перешли на secure area
-            current_url = driver.current_url
-            allure.attach(current_url, "URL после авторизации", allure.attachment_type.TEXT)
-            assert "secure" in current_url, \
-                f"После успешной авторизации должен быть переход на secure area, текущий URL: {current_url}"
-            
-            # Проверяем наличие кнопки выхода
-            logout_buttons = driver.find_elements(By.CSS_SELECTOR, "a[href='/logout']")
-            assert len(logout_buttons) > 0, "Кнопка выхода должна присутствовать после успешной авторизации"
-    
-    @allure.title("Неуспешная авторизация с некорректными данными")
-    @allure.description("""
-    Тест проверяет блокировку авторизации при использовании некорректных учётных данных.
-    
-    Шаги:
-    1. Открыть страницу авторизации
-    2. Ввести некорректное имя пользователя
-    3. Ввести некорректный пароль
-    4. Нажать кнопку входа
-    5. Проверить неуспешную авторизацию и сообщение об ошибке
-    """)
-    @allure.severity(allure.severity_level.CRITICAL)
-    @allure.tag("negative", "login", "security")
-    def test_unsuccessful_login(self, driver):
-        """
-        Тест неуспешной авторизации.
-        
-        Проверяет:
-        - Блокировку входа с некорректными данными
+        Проверяет для неуспешного входа:
         - Отображение сообщения об ошибке
         - Остаемся на странице логина
         - Отсутствие кнопки выхода
         
         Args:
             driver: Фикстура WebDriver
+            title: Название сценария в отчёте Allure
+            username: Имя пользователя
+            password: Пароль
+            expect_success: Ожидается ли успешная авторизация
+            expected_message: Ожидаемый фрагмент сообщения
+            severity: Важность сценария в отчёте Allure
+            tags: Теги сценария в отчёте Allure
+            native_click: Отправить форму настоящим нажатием кнопки
         """
+        # Пароль не выводим в отчёт, служебные колонки не дублируем в параметрах
+        allure.dynamic.parameter("password", "***", mode=allure.parameter_mode.MASKED)
+        allure.dynamic.parameter("title", title, excluded=True)
+        allure.dynamic.parameter("severity", str(severity), excluded=True)
+        allure.dynamic.parameter("tags", ", ".join(tags), excluded=True)
+        allure.dynamic.severity(severity)
+        allure.dynamic.tag(*tags)
+
         with allure.step("Инициализация Page Object"):
             login_page = LoginPage(driver)
         
         with allure.step("Открытие страницы авторизации"):
             login_page.open_login_page()
         
-        with allure.step("Выполнение авторизации с некорректными данными"):
-            login_page.perform_login(self.INVALID_USERNAME, self.INVALID_PASSWORD)
-        
-        with allure.step("Проверка результатов неуспешной авторизации"):
-            # Основная проверка - авторизация НЕ успешна
-            assert login_page.is_login_failed(), \
-                "Авторизация должна быть неуспешной с некорректными данными"
-            
-            # Дополнительные проверки
-            error_message = login_page.get_error_message_text()
-            assert "Your username is invalid!" in error_message, \
-                f"Ожидалось сообщение об ошибке, получено: '{error_message}'"
-            
-            # Проверяем что остались на странице логина
-            current_url = driver.current_url
-            allure.attach(current_url, "URL после неуспешной авторизации", allure.attachment_type.TEXT)
-            assert "login" in current_url, \
-                f"После неуспешной авторизации должны остаться на странице логина, текущий URL: {current_url}"
-            
-            # Проверяем отсутствие кнопки выхода
-            logout_buttons = driver.find_elements(By.CSS_SELECTOR, "a[href='/logout']")
-            assert len(logout_buttons) == 0, "Кнопка выхода НЕ должна присутствовать после неуспешной авторизации"
-    
-    @allure.title("Авторизация с пустыми учётными данными")
-    @allure.description("""
-    Тест проверяет обработку попытки авторизации с пустыми полями.
-    
-    Шаги:
-    1. Открыть страницу авторизации
-    2. Оставить поля пустыми
-    3. Нажать кнопку входа
-    4. Проверить обработку ошибки
-    """)
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("negative", "validation", "edge-case")
-    def test_empty_credentials_login(self, driver):
-        """
-        Тест авторизации с пустыми данными.
-        
-        Проверяет:
-        - Обработку пустых полей
-        - Отображение соответствующего сообщения об ошибке
-        
-        Args:
-            driver: Фикстура WebDriver
-        """
-        with allure.step("Инициализация Page Object"):
-            login_page = LoginPage(driver)
-        
-        with allure.step("Открытие страницы авторизации"):
-            login_page.open_login_page()
-        
-        with allure.step("Попытка авторизации с пустыми данными"):
-            login_page.perform_login("", "")
-        
-        with allure.step("Проверка обработки пустых данных"):
-            assert login_page.is_login_failed(), \
-                "Авторизация должна быть неуспешной с пустыми данными"
-            
-            # Проверяем что остались на странице логина
-            current_url = driver.current_url
-            allure.attach(current_url, "URL после авторизации с пустыми данными", allure.attachment_type.TEXT)
-            assert "login" in current_url, \
-                "После авторизации с пустыми данными должны остаться на странице логина"
-    
-    @allure.title("Авторизация с корректным логином и неверным паролем")
-    @allure.description("""
-    Тест проверяет обработку случая, когда логин корректный, но пароль неверный.
-    
-    Шаги:
-    1. Открыть страницу авторизации
-    2. Ввести корректный логин
-    3. Ввести неверный пароль
-    4. Нажать кнопку входа
-    5. Проверить специфичное сообщение об ошибке пароля
-    """)
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("negative", "security", "password")
-    def test_invalid_password_valid_username(self, driver):
-        """
-        Тест с корректным логином но неверным паролем.
-        
-        Проверяет:
-        - Обработку случая с правильным логином и неверным паролем
-        - Специфичное сообщение об ошибке пароля
-        
-        Args:
-            driver: Фикстура WebDriver
-        """
-        with allure.step("Инициализация Page Object"):
-            login_page = LoginPage(driver)
-        
-        with allure.step("Открытие страницы авторизации"):
-            login_page.open_login_page()
-        
-        with allure.step("Авторизация с корректным логином и неверным паролем"):
-            login_page.perform_login(self.VALID_USERNAME, self.INVALID_PASSWORD)
-        
-        with allure.step("Проверка сообщения об ошибке пароля"):
-            assert login_page.is_login_failed(), \
-                "Авторизация должна быть неуспешной с неверным паролем"
-            
-            error_message = login_page.get_error_message_text()
-            assert "Your password is invalid!" in error_message, \
-                f"Ожидалось сообщение об ошибке пароля, получено: '{error_message}'"
+        with allure.step("Выполнение авторизации"):
+            login_page.perform_login(username, password, native_click=native_click)
+        
+        if expect_success:
+            with allure.step("Проверка результатов авторизации"):
+                # Основная проверка - авторизация успешна
+                assert login_page.is_login_successful(), \
+                    "Авторизация должна быть успешной с корректными данными"
+                
+                # Дополнительные проверки
+                success_message = login_page.get_success_message_text()
+                assert expected_message in success_message, \
+                    f"Ожидалось сообщение об успехе, получено: '{success_message}'"
+                
+                # URL и кнопку выхода получаем одним запросом к браузеру
+                result = login_page.snapshot_result()
+                
+                # Проверяем что перешли на secure area
+                assert "secure" in result["url"], \
+                    f"После успешной авторизации должен быть переход на secure area, текущий URL: {result['url']}"
+                
+                # Проверяем наличие кнопки выхода
+                assert result["logout"], "Кнопка выхода должна присутствовать после успешной авторизации"
+        else:
+            with allure.step("Проверка результатов неуспешной авторизации"):
+                # Основная проверка - авторизация НЕ успешна
+                assert login_page.is_login_failed(), \
+                    "Авторизация должна быть неуспешной с некорректными данными"
+                
+                # Дополнительные проверки
+                error_message = login_page.get_error_message_text()
+                assert expected_message in error_message, \
+                    f"Ожидалось сообщение об ошибке, получено: '{error_message}'"
+                
+                # URL и кнопку выхода получаем одним запросом к браузеру
+                result = login_page.snapshot_result()
+                
+                # Проверяем что остались на странице логина
+                assert "login" in result["url"], \
+                    f"После неуспешной авторизации должны остаться на странице логина, текущий URL: {result['url']}"
+                
+                # Проверяем отсутствие кнопки выхода
+                assert not result["logout"], "Кнопка выхода НЕ должна присутствовать после неуспешной авторизации"
     
     @allure.title("Проверка наличия элементов интерфейса")
     @allure.description("""
@@ -421,46 +480,47 @@ class TestLoginForm:
         with allure.step("Открытие страницы авторизации"):
             login_page.open_login_page()
         
+        with allure.step("Получение состояния формы одним запросом"):
+            form_state = login_page.get_form_state()
+        
         with allure.step("Проверка заголовка страницы"):
-            page_title = driver.title
-            allure.attach(page_title, "Заголовок страницы", allure.attachment_type.TEXT)
+            page_title = form_state["title"]
+            if ALLURE_VERBOSE:
+                allure.attach(page_title, "Заголовок страницы", allure.attachment_type.TEXT)
             assert "The Internet" in page_title, \
                 f"Ожидался заголовок 'The Internet', получен: '{page_title}'"
         
         with allure.step("Проверка наличия поля логина"):
-            username_fields = driver.find_elements(*login_page.username_field)
-            assert len(username_fields) == 1, "Поле логина должно присутствовать на странице"
+            assert form_state["username_count"] == 1, "Поле логина должно присутствовать на странице"
         
         with allure.step("Проверка наличия поля пароля"):
-            password_fields = driver.find_elements(*login_page.password_field)
-            assert len(password_fields) == 1, "Поле пароля должно присутствовать на странице"
+            assert form_state["password_count"] == 1, "Поле пароля должно присутствовать на странице"
         
         with allure.step("Проверка наличия кнопки входа"):
-            login_buttons = driver.find_elements(*login_page.login_button)
-            assert len(login_buttons) == 1, "Кнопка входа должна присутствовать на странице"
+            assert form_state["login_button_count"] == 1, "Кнопка входа должна присутствовать на странице"
         
         with allure.step("Проверка активности элементов формы"):
-            login_button = login_buttons[0]
-            button_text = login_button.text.strip()
-            allure.attach(button_text, "Текст кнопки входа", allure.attachment_type.TEXT)
+            button_text = form_state["button_text"].strip()
+            if ALLURE_VERBOSE:
+                allure.attach(button_text, "Текст кнопки входа", allure.attachment_type.TEXT)
             assert button_text.lower() in ["login", "log in", "войти"], \
                 f"Кнопка должна иметь текст для входа, получен: '{button_text}'"
             
             # Проверяем что поля доступны для ввода
-            username_element = driver.find_element(*login_page.username_field)
-            password_element = driver.find_element(*login_page.password_field)
-            
-            assert username_element.is_enabled(), "Поле логина должно быть активным"
-            assert password_element.is_enabled(), "Поле пароля должно быть активным"
-            assert login_button.is_enabled(), "Кнопка входа должна быть активной"
+            assert form_state["username_enabled"], "Поле логина должно быть активным"
+            assert form_state["password_enabled"], "Поле пароля должно быть активным"
+            assert form_state["login_button_enabled"], "Кнопка входа должна быть активной"
 
 
 # Фикстура для WebDriver с поддержкой Allure
-@pytest.fixture
-def driver():
+@pytest.fixture(scope="session")
+def driver(request):
     """
     Фикстура для создания и настройки WebDriver.
     
+    Браузер запускается один раз на всю сессию тестирования,
+    состояние между тестами сбрасывает фикстура _reset_browser.
+    
     Yields:
         WebDriver: Настроенный экземпляр Chrome WebDriver
     """
@@ -471,9 +531,26 @@ def driver():
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
+        # Связь chromedriver с браузером через pipe вместо TCP-порта
+        options.add_argument("--remote-debugging-pipe")
+        # Не ждём загрузки всех ресурсов: готовность формы проверяют явные ожидания
+        options.page_load_strategy = "eager"
+        
+        # Изображения и шрифты тестам не нужны - не загружаем их
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+        
+        # Логи консоли буферизуются только если их собирает хотя бы один тест
+        if any(item.get_closest_marker("capture_logs") for item in request.session.items):
+            options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
         
         driver = webdriver.Chrome(options=options)
-        driver.implicitly_wait(10)
+        # Только явные ожидания: неявное суммируется с WebDriverWait
+        # и задерживает каждую проверку отсутствия элемента
+        driver.implicitly_wait(0)
         
         allure.attach(driver.capabilities["browserVersion"], 
                      "Версия браузера", allure.attachment_type.TEXT)
@@ -482,48 +559,20 @@ def driver():
     try:
         yield driver
     finally:
+        # Скриншот упавшего теста прикрепляет хук pytest_runtest_makereport
         with allure.step("Закрытие WebDriver"):
-            # Прикрепляем скриншот в случае ошибки
-            if hasattr(driver, 'get_screenshot_as_png'):
-                try:
-                    allure.attach(driver.get_screenshot_as_png(), 
-                                "Финальный скриншот", allure.attachment_type.PNG)
-                except Exception:
-                    pass
             driver.quit()
 
 
-# Дополнительные фикстуры для тестовых данных
-@pytest.fixture
-def valid_credentials():
-    """Фикстура с корректными данными авторизации."""
-    return {
-        "username": "tomsmith",
-        "password": "SuperSecretPassword!"
-    }
-
-
-@pytest.fixture
-def invalid_credentials():
-    """Фикстура с некорректными данными авторизации."""
-    return [
-        {"username": "invaliduser", "password": "wrongpassword"},
-        {"username": "tomsmith", "password": "wrongpassword"},
-        {"username": "invaliduser", "password": "SuperSecretPassword!"},
-        {"username": "", "password": ""},
-        {"username": "tomsmith", "password": ""}
-    ]
-
-
-@pytest.fixture
-def login_page(driver):
-    """Фикстура для создания Page Object."""
-    return LoginPage(driver)
+@pytest.fixture(autouse=True)
+def _reset_browser(driver):
+    """Сброс cookies и переход на пустую страницу после каждого теста."""
+    yield
+    
+    driver.delete_all_cookies()
+    driver.get("about:blank")
 
 
-# Маркеры для категоризации тестов
-pytestmark = [
-    pytest.mark.ui,
-    pytest.mark.selenium,
-    pytest.mark.login
-]
\ No newline at end of file
+# Маркер модуля; login, positive, negative и edge_case
+# расставляет pytest_collection_modifyitems в conftest.py
+pytestmark = pytest.mark.selenium
\ No newline at end of file